@@ -13,8 +13,6 @@
 ##############################################################################
 """Bootstrap schema interfaces and exceptions
 """
-from functools import total_ordering
-
 import zope.interface
 from zope.interface import Attribute
 from zope.interface.interfaces import IInterface
@@ -24,6 +22,8 @@ from zope.schema._messageid import _
 # pylint:disable=inherit-non-class,keyword-arg-before-vararg,
 # pylint:disable=no-self-argument
 
+_marker = object()
+
 
 class StopValidation(Exception):
     """Raised if the validation is completed early.
@@ -33,7 +33,6 @@ class StopValidation(Exception):
     """
 
 
-@total_ordering
 class ValidationError(zope.interface.Invalid):
     """Raised if the Validation process fails."""
 
@@ -43,6 +42,12 @@ class ValidationError(zope.interface.Invalid):
     #: The value that failed validation.
     value = None
 
+    #: Allows ``case TooBig(value, field):`` in ``match`` statements
+    #: (Python 3.10 and later).
+    #:
+    #: .. versionadded:: 6.0.1
+    __match_args__ = ('value', 'field')
+
     def with_field_and_value(self, field, value):
         self.field = field
         self.value = value
@@ -51,26 +56,61 @@ class ValidationError(zope.interface.Invalid):
     def doc(self):
         return self.__class__.__doc__
 
+    # There's no particular reason we choose to sort this way,
+    # it's just the way we used to do it with __cmp__. Each operator
+    # is spelled out, rather than derived with ``functools.total_ordering``,
+    # so that comparing errors (e.g., when sorting them) costs only one
+    # ``args`` comparison.
+
     def __lt__(self, other):
-        # There's no particular reason we choose to sort this way,
-        # it's just the way we used to do it with __cmp__.
-        if not hasattr(other, 'args'):
-            return True
-        return self.args < other.args
+        other_args = getattr(other, 'args', _marker)
+        if other_args is _marker:
+            return NotImplemented
+        return self.args < other_args
+
+    def __le__(self, other):
+        other_args = getattr(other, 'args', _marker)
+        if other_args is _marker:
+            return NotImplemented
+        return self.args <= other_args
+
+    def __gt__(self, other):
+        other_args = getattr(other, 'args', _marker)
+        if other_args is _marker:
+            return NotImplemented
+        return self.args > other_args
+
+    def __ge__(self, other):
+        other_args = getattr(other, 'args', _marker)
+        if other_args is _marker:
+            return NotImplemented
+        return self.args >= other_args
 
     def __eq__(self, other):
-        if not hasattr(other, 'args'):
-            return False
-        return self.args == other.args
-
-    # XXX : This is probably inconsistent with __eq__, which is
-    # a violation of the language spec.
-    __hash__ = zope.interface.Invalid.__hash__  # python3
-
-    def __repr__(self):  # pragma: no cover
+        other_args = getattr(other, 'args', _marker)
+        if other_args is _marker:
+            return NotImplemented
+        return self.args == other_args
+
+    def __ne__(self, other):
+        other_args = getattr(other, 'args', _marker)
+        if other_args is _marker:
+            return NotImplemented
+        return self.args != other_args
+
+    def __hash__(self):
+        # Errors are compared by their ``args``, so they hash by them too.
+        try:
+            return hash(self.args)
+        except TypeError:
+            # Unhashable arguments, such as the list of errors given to
+            # WrongContainedType. Fall back to identity.
+            return zope.interface.Invalid.__hash__(self)
+
+    def __repr__(self):
         return '%s(%s)' % (
-            self.__class__.__name__,
-            ', '.join(repr(arg) for arg in self.args))
+            type(self).__name__,
+            ', '.join(map(repr, self.args)))
 
 
 class RequiredMissing(ValidationError):
@@ -347,9 +387,32 @@ class IValidatable(zope.interface.Interface):
         """
 
 
-class NO_VALUE(object):
-    def __repr__(self):  # pragma: no cover
+class _NoValueType(object):
+    """
+    The type of the `NO_VALUE` singleton.
+
+    Like ``None``, the singleton is false and survives copying and
+    pickling, so it can always be checked with ``is``.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
         return '<NO_VALUE>'
 
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__  # Python 2
+
+    def __reduce__(self):
+        return 'NO_VALUE'
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
 
-NO_VALUE = NO_VALUE()
+NO_VALUE = _NoValueType()
@@ -19,6 +19,19 @@ import unicodedata
 # pylint:disable=protected-access,inherit-non-class,blacklisted-name
 # pylint:disable=attribute-defined-outside-init
 
+# Values of the wrong type for Text and TextLine fields.
+NOT_TEXT = (
+    b'',
+    1,
+    1.0,
+    (),
+    [],
+    {},
+    set(),
+    frozenset(),
+    object(),
+)
+
 
 class InterfaceConformanceTestsMixin(object):
 
@@ -275,6 +288,33 @@ class WrongTypeTestsMixin(object):
             self.assertRaisesWrongType(field, expected_type, value)
 
 
+class RequiredTestsMixin(object):
+
+    #: Values that validate whether or not the field is required.
+    NOT_MISSING = ()
+
+    def test_validate_not_required(self):
+        field = self._makeOne(required=False)
+        for value in self.NOT_MISSING:
+            field.validate(value)
+        field.validate(None)
+
+    def test_validate_required(self):
+        from zope.schema.interfaces import RequiredMissing
+        field = self._makeOne()
+        for value in self.NOT_MISSING:
+            field.validate(value)
+        with self.assertRaises(RequiredMissing):
+            field.validate(None)
+
+
+class TextWrongTypeTestsMixin(WrongTypeTestsMixin):
+
+    def test_validate_wrong_types(self):
+        field = self._makeOne()
+        self.assertAllRaiseWrongType(field, field._type, *NOT_TEXT)
+
+
 class ValidatedPropertyTests(unittest.TestCase):
 
     def _getTargetClass(self):
@@ -304,9 +344,8 @@ class ValidatedPropertyTests(unittest.TestCase):
             prop = self._makeOne('_prop')
         inst = Test(ValueError)
 
-        def _provoke(inst):
+        with self.assertRaises(ValueError):
             inst.prop = 'PROP'
-        self.assertRaises(ValueError, _provoke, inst)
         self.assertEqual(inst._prop, None)
 
     def test___set___w_missing_wo_check(self):
@@ -342,9 +381,8 @@ class DefaultPropertyTests(unittest.TestCase):
         inst = Test()
         inst.defaultFactory = None
 
-        def _provoke(inst):
-            return inst.prop
-        self.assertRaises(KeyError, _provoke, inst)
+        with self.assertRaises(KeyError):
+            inst.prop
 
     def test___get___wo_defaultFactory_hit(self):
         class Test(DummyInst):
@@ -373,9 +411,8 @@ class DefaultPropertyTests(unittest.TestCase):
             return 'PROP'
         inst.defaultFactory = _factory
 
-        def _provoke(inst):
-            return inst.prop
-        self.assertRaises(ValueError, _provoke, inst)
+        with self.assertRaises(ValueError):
+            inst.prop
 
     def test___get___w_defaultFactory_w_ICAF_w_check(self):
         from zope.interface import directlyProvides
@@ -673,11 +710,9 @@ class FieldTests(EqualityTestsMixin,
         obj = object()
         field = self._makeOne()
         bound = field.bind(obj)
-        self.assertEqual(bound.context, obj)
-        expected = dict(field.__dict__)
-        found = dict(bound.__dict__)
-        found.pop('context')
-        self.assertEqual(found, expected)
+        self.assertIs(bound.context, obj)
+        expected = dict(field.__dict__, context=obj)
+        self.assertEqual(bound.__dict__, expected)
         self.assertEqual(bound.__class__, field.__class__)
 
     def test_validate_missing_not_required(self):
@@ -695,7 +730,8 @@ class FieldTests(EqualityTestsMixin,
         field = self._makeOne(  # pragma: no branch
             required=True, missing_value=missing, constraint=lambda x: False,
         )
-        self.assertRaises(RequiredMissing, field.validate, missing)
+        with self.assertRaises(RequiredMissing):
+            field.validate(missing)
 
     def test_validate_wrong_type(self):
 
@@ -710,7 +746,8 @@ class FieldTests(EqualityTestsMixin,
 
         field = self._makeOne(required=True, constraint=lambda x: False)
         field._type = int
-        self.assertRaises(ConstraintNotSatisfied, field.validate, 1)
+        with self.assertRaises(ConstraintNotSatisfied):
+            field.validate(1)
 
     def test_validate_constraint_raises_StopValidation(self):
         from zope.schema._bootstrapinterfaces import StopValidation
@@ -748,7 +785,8 @@ class FieldTests(EqualityTestsMixin,
     def test_get_miss(self):
         field = self._makeOne(__name__='nonesuch')
         inst = DummyInst()
-        self.assertRaises(AttributeError, field.get, inst)
+        with self.assertRaises(AttributeError):
+            field.get(inst)
 
     def test_get_hit(self):
         field = self._makeOne(__name__='extant')
@@ -775,7 +813,8 @@ class FieldTests(EqualityTestsMixin,
     def test_set_readonly(self):
         field = self._makeOne(__name__='lirame', readonly=True)
         inst = DummyInst()
-        self.assertRaises(TypeError, field.set, inst, 'VALUE')
+        with self.assertRaises(TypeError):
+            field.set(inst, 'VALUE')
 
     def test_set_hit(self):
         field = self._makeOne(__name__='extant')
@@ -786,6 +825,7 @@ class FieldTests(EqualityTestsMixin,
 
 
 class ContainerTests(EqualityTestsMixin,
+                     RequiredTestsMixin,
                      unittest.TestCase):
 
     def _getTargetClass(self):
@@ -796,15 +836,6 @@ class ContainerTests(EqualityTestsMixin,
         from zope.schema.interfaces import IContainer
         return IContainer
 
-    def test_validate_not_required(self):
-        field = self._makeOne(required=False)
-        field.validate(None)
-
-    def test_validate_required(self):
-        from zope.schema.interfaces import RequiredMissing
-        field = self._makeOne()
-        self.assertRaises(RequiredMissing, field.validate, None)
-
     def test__validate_not_collection_not_iterable(self):
         from zope.schema._bootstrapinterfaces import NotAContainer
         cont = self._makeOne()
@@ -874,11 +905,7 @@ class OrderableTests(unittest.TestCase):
 
     def _makeOne(self, *args, **kw):
         # Orderable is a mixin for a type derived from Field
-        from zope.schema._bootstrapfields import Field
-
-        class Mixed(self._getTargetClass(), Field):
-            pass
-        return Mixed(*args, **kw)
+        return _mixedWithField(self._getTargetClass())(*args, **kw)
 
     def test_ctor_defaults(self):
         ordb = self._makeOne()
@@ -889,12 +916,14 @@ class OrderableTests(unittest.TestCase):
     def test_ctor_default_too_small(self):
         # This test exercises _validate, too
         from zope.schema._bootstrapinterfaces import TooSmall
-        self.assertRaises(TooSmall, self._makeOne, min=0, default=-1)
+        with self.assertRaises(TooSmall):
+            self._makeOne(min=0, default=-1)
 
     def test_ctor_default_too_large(self):
         # This test exercises _validate, too
         from zope.schema._bootstrapinterfaces import TooBig
-        self.assertRaises(TooBig, self._makeOne, max=10, default=11)
+        with self.assertRaises(TooBig):
+            self._makeOne(max=10, default=11)
 
 
 class MinMaxLenTests(LenTestsMixin,
@@ -906,11 +935,7 @@ class MinMaxLenTests(LenTestsMixin,
 
     def _makeOne(self, *args, **kw):
         # MinMaxLen is a mixin for a type derived from Field
-        from zope.schema._bootstrapfields import Field
-
-        class Mixed(self._getTargetClass(), Field):
-            pass
-        return Mixed(*args, **kw)
+        return _mixedWithField(self._getTargetClass())(*args, **kw)
 
     def test_ctor_defaults(self):
         mml = self._makeOne()
@@ -927,9 +952,12 @@ class MinMaxLenTests(LenTestsMixin,
 
 
 class TextTests(EqualityTestsMixin,
-                WrongTypeTestsMixin,
+                TextWrongTypeTestsMixin,
+                RequiredTestsMixin,
                 unittest.TestCase):
 
+    NOT_MISSING = (u'', u'abc', u'abc\ndef')
+
     def _getTargetClass(self):
         from zope.schema._bootstrapfields import Text
         return Text
@@ -943,42 +971,11 @@ class TextTests(EqualityTestsMixin,
         txt = self._makeOne()
         self.assertEqual(txt._type, text_type)
 
-    def test_validate_wrong_types(self):
-        field = self._makeOne()
-        self.assertAllRaiseWrongType(
-            field,
-            field._type,
-            b'',
-            1,
-            1.0,
-            (),
-            [],
-            {},
-            set(),
-            frozenset(),
-            object())
-
     def test_validate_w_invalid_default(self):
 
         from zope.schema.interfaces import ValidationError
-        self.assertRaises(ValidationError, self._makeOne, default=b'')
-
-    def test_validate_not_required(self):
-
-        field = self._makeOne(required=False)
-        field.validate(u'')
-        field.validate(u'abc')
-        field.validate(u'abc\ndef')
-        field.validate(None)
-
-    def test_validate_required(self):
-        from zope.schema.interfaces import RequiredMissing
-
-        field = self._makeOne()
-        field.validate(u'')
-        field.validate(u'abc')
-        field.validate(u'abc\ndef')
-        self.assertRaises(RequiredMissing, field.validate, None)
+        with self.assertRaises(ValidationError):
+            self._makeOne(default=b'')
 
     def test_fromUnicode_miss(self):
         deadbeef = b'DEADBEEF'
@@ -1037,9 +1034,12 @@ class TextTests(EqualityTestsMixin,
 
 
 class TextLineTests(EqualityTestsMixin,
-                    WrongTypeTestsMixin,
+                    TextWrongTypeTestsMixin,
+                    RequiredTestsMixin,
                     unittest.TestCase):
 
+    NOT_MISSING = (u'', u'abc')
+
     def _getTargetClass(self):
         from zope.schema._field import TextLine
         return TextLine
@@ -1048,36 +1048,6 @@ class TextLineTests(EqualityTestsMixin,
         from zope.schema.interfaces import ITextLine
         return ITextLine
 
-    def test_validate_wrong_types(self):
-        field = self._makeOne()
-        self.assertAllRaiseWrongType(
-            field,
-            field._type,
-            b'',
-            1,
-            1.0,
-            (),
-            [],
-            {},
-            set(),
-            frozenset(),
-            object())
-
-    def test_validate_not_required(self):
-
-        field = self._makeOne(required=False)
-        field.validate(u'')
-        field.validate(u'abc')
-        field.validate(None)
-
-    def test_validate_required(self):
-        from zope.schema.interfaces import RequiredMissing
-
-        field = self._makeOne()
-        field.validate(u'')
-        field.validate(u'abc')
-        self.assertRaises(RequiredMissing, field.validate, None)
-
     def test_constraint(self):
 
         field = self._makeOne()
@@ -1087,9 +1057,12 @@ class TextLineTests(EqualityTestsMixin,
 
 
 class PasswordTests(EqualityTestsMixin,
-                    WrongTypeTestsMixin,
+                    TextWrongTypeTestsMixin,
+                    RequiredTestsMixin,
                     unittest.TestCase):
 
+    NOT_MISSING = (u'', u'abc')
+
     def _getTargetClass(self):
         from zope.schema._bootstrapfields import Password
         return Password
@@ -1104,8 +1077,7 @@ class PasswordTests(EqualityTestsMixin,
         inst = DummyInst()
         before = dict(inst.__dict__)
         pw.set(inst, klass.UNCHANGED_PASSWORD)  # doesn't raise, doesn't write
-        after = dict(inst.__dict__)
-        self.assertEqual(after, before)
+        self.assertEqual(inst.__dict__, before)
 
     def test_set_normal(self):
         pw = self._makeOne(__name__='password')
@@ -1113,21 +1085,6 @@ class PasswordTests(EqualityTestsMixin,
         pw.set(inst, 'PASSWORD')
         self.assertEqual(inst.password, 'PASSWORD')
 
-    def test_validate_not_required(self):
-
-        field = self._makeOne(required=False)
-        field.validate(u'')
-        field.validate(u'abc')
-        field.validate(None)
-
-    def test_validate_required(self):
-        from zope.schema.interfaces import RequiredMissing
-
-        field = self._makeOne()
-        field.validate(u'')
-        field.validate(u'abc')
-        self.assertRaises(RequiredMissing, field.validate, None)
-
     def test_validate_unchanged_not_already_set(self):
         klass = self._getTargetClass()
         inst = DummyInst()
@@ -1289,7 +1246,10 @@ class RationalTests(NumberTests):
         return IRational
 
 
-class IntegralTests(RationalTests):
+class IntegralTests(RequiredTestsMixin,
+                    RationalTests):
+
+    NOT_MISSING = (10, 0, -1)
 
     def _getTargetClass(self):
         from zope.schema._bootstrapfields import Integral
@@ -1299,26 +1259,14 @@ class IntegralTests(RationalTests):
         from zope.schema.interfaces import IIntegral
         return IIntegral
 
-    def test_validate_not_required(self):
-        field = self._makeOne(required=False)
-        field.validate(None)
-        field.validate(10)
-        field.validate(0)
-        field.validate(-1)
-
-    def test_validate_required(self):
-        from zope.schema.interfaces import RequiredMissing
-        field = self._makeOne()
-        field.validate(10)
-        field.validate(0)
-        field.validate(-1)
-        self.assertRaises(RequiredMissing, field.validate, None)
-
     def test_fromUnicode_miss(self):
         txt = self._makeOne()
-        self.assertRaises(ValueError, txt.fromUnicode, u'')
-        self.assertRaises(ValueError, txt.fromUnicode, u'False')
-        self.assertRaises(ValueError, txt.fromUnicode, u'True')
+        with self.assertRaises(ValueError):
+            txt.fromUnicode(u'')
+        with self.assertRaises(ValueError):
+            txt.fromUnicode(u'False')
+        with self.assertRaises(ValueError):
+            txt.fromUnicode(u'True')
 
     def test_fromUnicode_hit(self):
 
@@ -1344,7 +1292,8 @@ class IntTests(IntegralTests):
         self.assertEqual(txt._type, integer_types)
 
 
-class DecimalTests(NumberTests):
+class DecimalTests(RequiredTestsMixin,
+                   NumberTests):
 
     mvm_missing_value = decimal.Decimal("-1")
     mvm_default = decimal.Decimal("0")
@@ -1354,6 +1303,11 @@ class DecimalTests(NumberTests):
     VALID = tuple(decimal.Decimal(x) for x in NumberTests.VALID)
     TOO_SMALL = tuple(decimal.Decimal(x) for x in NumberTests.TOO_SMALL)
     TOO_BIG = tuple(decimal.Decimal(x) for x in NumberTests.TOO_BIG)
+    NOT_MISSING = (
+        decimal.Decimal("10.0"),
+        decimal.Decimal("0.93"),
+        decimal.Decimal("1000.0003"),
+    )
 
     def _getTargetClass(self):
         from zope.schema._bootstrapfields import Decimal
@@ -1363,26 +1317,13 @@ class DecimalTests(NumberTests):
         from zope.schema.interfaces import IDecimal
         return IDecimal
 
-    def test_validate_not_required(self):
-        field = self._makeOne(required=False)
-        field.validate(decimal.Decimal("10.0"))
-        field.validate(decimal.Decimal("0.93"))
-        field.validate(decimal.Decimal("1000.0003"))
-        field.validate(None)
-
-    def test_validate_required(self):
-        from zope.schema.interfaces import RequiredMissing
-        field = self._makeOne()
-        field.validate(decimal.Decimal("10.0"))
-        field.validate(decimal.Decimal("0.93"))
-        field.validate(decimal.Decimal("1000.0003"))
-        self.assertRaises(RequiredMissing, field.validate, None)
-
     def test_fromUnicode_miss(self):
         from zope.schema.interfaces import ValidationError
         flt = self._makeOne()
-        self.assertRaises(ValueError, flt.fromUnicode, u'')
-        self.assertRaises(ValueError, flt.fromUnicode, u'abc')
+        with self.assertRaises(ValueError):
+            flt.fromUnicode(u'')
+        with self.assertRaises(ValueError):
+            flt.fromUnicode(u'abc')
         with self.assertRaises(ValueError) as exc:
             flt.fromUnicode(u'1.4G')
 
@@ -1506,7 +1447,8 @@ class ObjectTests(EqualityTestsMixin,
     def test_validate_required(self):
         from zope.schema.interfaces import RequiredMissing
         field = self._makeOne(required=True)
-        self.assertRaises(RequiredMissing, field.validate, None)
+        with self.assertRaises(RequiredMissing):
+            field.validate(None)
 
     def test__validate_w_empty_schema(self):
         from zope.interface import Interface
@@ -1686,7 +1628,8 @@ class ObjectTests(EqualityTestsMixin,
         unit = Unit(person1, [person2, person3])
         person1.unit = unit
         person2.unit = unit
-        self.assertRaises(SchemaNotCorrectlyImplemented, field.validate, unit)
+        with self.assertRaises(SchemaNotCorrectlyImplemented):
+            field.validate(unit)
 
     def test_set_emits_IBOAE(self):
         from zope.event import subscribers
@@ -1934,6 +1877,23 @@ class ObjectTests(EqualityTestsMixin,
         self.assertIn(":Must Provide: :class:", doc)
 
 
+_mixed_with_field = {}
+
+
+def _mixedWithField(mixin):
+    # Create the Field subclass for *mixin* only once; building a new
+    # class for every test is relatively expensive.
+    try:
+        return _mixed_with_field[mixin]
+    except KeyError:
+        from zope.schema._bootstrapfields import Field
+
+        class Mixed(mixin, Field):
+            pass
+        _mixed_with_field[mixin] = Mixed
+        return Mixed
+
+
 class DummyInst(object):
     missing_value = object()
 
@@ -35,10 +35,40 @@ class ValidationErrorTests(unittest.TestCase):
         inst = Derived()
         self.assertEqual(inst.doc(), 'DERIVED')
 
+    def test_doc_is_not_inherited(self):
+        # Like ``__doc__`` itself, ``doc()`` is per-class.
+        class Derived(self._getTargetClass()):
+            """DERIVED"""
+
+        class NoDoc(Derived):
+            pass
+        self.assertIsNone(NoDoc().doc())
+
+    def test_doc_is_translatable_message(self):
+        from zope.schema._bootstrapinterfaces import RequiredMissing
+        doc = RequiredMissing().doc()
+        self.assertIs(doc, RequiredMissing.__doc__)
+        self.assertEqual(doc.domain, 'zope')
+
+    def test___match_args__(self):
+        self.assertEqual(self._getTargetClass().__match_args__,
+                         ('value', 'field'))
+
+    def test___repr__(self):
+        self.assertEqual(repr(self._makeOne()), 'ValidationError()')
+        self.assertEqual(repr(self._makeOne(1)), 'ValidationError(1)')
+        self.assertEqual(repr(self._makeOne(1, None)),
+                         'ValidationError(1, None)')
+
     def test___cmp___no_args(self):
         ve = self._makeOne()
-        self.assertEqual(compare(ve, object()), -1)
-        self.assertEqual(compare(object(), ve), 1)
+        other = object()
+        self.assertIs(ve.__lt__(other), NotImplemented)
+        self.assertIs(ve.__le__(other), NotImplemented)
+        self.assertIs(ve.__gt__(other), NotImplemented)
+        self.assertIs(ve.__ge__(other), NotImplemented)
+        self.assertIs(ve.__eq__(other), NotImplemented)
+        self.assertIs(ve.__ne__(other), NotImplemented)
 
     def test___cmp___hit(self):
         left = self._makeOne('abc')
@@ -47,11 +77,36 @@ class ValidationErrorTests(unittest.TestCase):
         self.assertEqual(compare(left, left), 0)
         self.assertEqual(compare(right, left), 1)
 
+    def test_ordering_w_args(self):
+        left = self._makeOne('abc')
+        right = self._makeOne('def')
+        self.assertTrue(left < right)
+        self.assertTrue(left <= right)
+        self.assertTrue(left <= left)
+        self.assertFalse(left > right)
+        self.assertTrue(right > left)
+        self.assertTrue(right >= left)
+        self.assertTrue(right >= right)
+        self.assertFalse(left >= right)
+        self.assertEqual(sorted([right, left]), [left, right])
+
     def test___eq___no_args(self):
         ve = self._makeOne()
         self.assertNotEqual(ve, object())
         self.assertNotEqual(object(), ve)
 
+    def test___eq___no_args_reflected(self):
+        # Objects without ``args`` get a chance to answer themselves.
+        class AlwaysEqual(object):
+            def __eq__(self, other):
+                return True
+
+            def __ne__(self, other):
+                return False
+        ve = self._makeOne()
+        self.assertTrue(ve == AlwaysEqual())
+        self.assertFalse(ve != AlwaysEqual())
+
     def test___eq___w_args(self):
         left = self._makeOne('abc')
         right = self._makeOne('def')
@@ -60,6 +115,43 @@ class ValidationErrorTests(unittest.TestCase):
         self.assertEqual(left, left)
         self.assertEqual(right, right)
 
+    def test___hash___w_args(self):
+        left = self._makeOne('abc')
+        right = self._makeOne('abc')
+        self.assertIsNot(left, right)
+        self.assertEqual(hash(left), hash(right))
+        self.assertEqual(hash(left), hash(('abc',)))
+        self.assertEqual(len({left, right}), 1)
+
+    def test___hash___follows_args(self):
+        ve = self._makeOne('a')
+        hash(ve)
+        ve.args = ('b',)
+        self.assertEqual(hash(ve), hash(self._makeOne('b')))
+        self.assertIn(self._makeOne('b'), {ve})
+
+    def test_mix_in_with_builtin_exception(self):
+        # ValidationError must not change the instance layout, so it can
+        # be combined with builtin exceptions that have their own.
+        for base in (AttributeError, OSError, ImportError, StopIteration,
+                     SyntaxError, UnicodeDecodeError):
+            type('Mixed', (self._getTargetClass(), base), {})
+
+    def test___hash___unhashable_args(self):
+        ve = self._makeOne(['abc'])
+        self.assertEqual(hash(ve), hash(ve))
+        self.assertNotEqual(hash(ve), hash(self._makeOne(['abc'])))
+
+    def test_pickle_preserves_field_and_value(self):
+        # ``field`` and ``value`` live in the instance dictionary, which
+        # is what BaseException pickles; slots would be lost.
+        import pickle
+        ve = self._makeOne('abc').with_field_and_value('field', 'value')
+        copy = pickle.loads(pickle.dumps(ve))
+        self.assertEqual(copy.args, ('abc',))
+        self.assertEqual(copy.field, 'field')
+        self.assertEqual(copy.value, 'value')
+
 
 class TestOutOfBounds(unittest.TestCase):
 
@@ -72,3 +164,34 @@ class TestOutOfBounds(unittest.TestCase):
 
     def test_TOO_SMALL_repr(self):
         self.assertIn('TOO_SMALL', repr(self._getTargetClass().TOO_SMALL))
+
+
+class TestNO_VALUE(unittest.TestCase):
+
+    def _getTarget(self):
+        from zope.schema._bootstrapinterfaces import NO_VALUE
+        return NO_VALUE
+
+    def test_repr(self):
+        self.assertEqual(repr(self._getTarget()), '<NO_VALUE>')
+
+    def test_false(self):
+        self.assertFalse(self._getTarget())
+
+    def test_copy(self):
+        import copy
+        NO_VALUE = self._getTarget()
+        self.assertIs(copy.copy(NO_VALUE), NO_VALUE)
+        self.assertIs(copy.deepcopy(NO_VALUE), NO_VALUE)
+        self.assertIs(copy.deepcopy([NO_VALUE])[0], NO_VALUE)
+
+    def test_pickle(self):
+        import pickle
+        NO_VALUE = self._getTarget()
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertIs(pickle.loads(pickle.dumps(NO_VALUE, proto)),
+                          NO_VALUE)
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self._getTarget().foo = 1